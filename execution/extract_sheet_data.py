@@ -6,6 +6,11 @@ import os
 import sys
 import json
 import re
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, repeat
+from urllib.parse import quote
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
@@ -16,17 +21,33 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+# Optional: orjson serializes large sheet dumps several times faster than
+# stdlib json and without an intermediate str
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: aiohttp fetches all per-sheet ranges concurrently on one event
+# loop when the single batchGet is not usable
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 # Scopes for Google Sheets API (read-only)
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
 
+# Precompiled at import so repeated calls skip the regex cache lookup
+_SHEET_ID_RE = re.compile(r'/spreadsheets/d/([a-zA-Z0-9-_]+)')
+
 def extract_spreadsheet_id(url_or_id: str) -> str:
     """Extract spreadsheet ID from URL or return if already an ID."""
-    pattern = r'/spreadsheets/d/([a-zA-Z0-9-_]+)'
-    match = re.search(pattern, url_or_id)
+    match = _SHEET_ID_RE.search(url_or_id)
     return match.group(1) if match else url_or_id.strip()
 
-def get_google_sheets_service():
-    """Authenticate and return Google Sheets API service."""
+def _get_credentials():
+    """Load (or interactively obtain) Google OAuth credentials."""
     creds = None
     project_root = Path(__file__).parent.parent
     token_path = project_root / 'token.json'
@@ -50,8 +71,54 @@ def get_google_sheets_service():
             )
             creds = flow.run_local_server(port=0)
         token_path.write_text(creds.to_json())
-    
-    return build('sheets', 'v4', credentials=creds)
+
+    return creds
+
+def get_google_sheets_service():
+    """Authenticate and return Google Sheets API service."""
+    # static_discovery skips downloading/parsing the discovery document on
+    # every build; the httplib2 transport already negotiates gzip on its own
+    return build('sheets', 'v4', credentials=_get_credentials(),
+                 static_discovery=True, cache_discovery=False)
+
+def _fetch_values_async(spreadsheet_id: str, ranges: List[str]) -> List[Dict]:
+    """
+    Fetch every range concurrently with aiohttp over one event loop.
+
+    Issues plain REST values.get calls with the OAuth bearer token, so N
+    sheets cost roughly one round-trip of wall time instead of N.
+    """
+    creds = _get_credentials()
+    if not creds.valid and creds.refresh_token:
+        creds.refresh(Request())
+    headers = {'Authorization': f'Bearer {creds.token}'}
+    base_url = f'https://sheets.googleapis.com/v4/spreadsheets/{spreadsheet_id}/values/'
+
+    async def fetch(session, range_notation):
+        url = (base_url + quote(range_notation, safe='')
+               + '?valueRenderOption=FORMATTED_VALUE')
+        async with session.get(url, headers=headers) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    async def gather_all():
+        connector = aiohttp.TCPConnector(limit=16)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await asyncio.gather(*[fetch(session, r) for r in ranges])
+
+    return asyncio.run(gather_all())
+
+# googleapiclient's httplib2 transport is not thread-safe, so the fallback
+# path gives each worker thread its own service object
+_thread_local = threading.local()
+
+def _worker_service():
+    """Return this thread's Sheets service, creating it lazily."""
+    service = getattr(_thread_local, 'service', None)
+    if service is None:
+        service = get_google_sheets_service()
+        _thread_local.service = service
+    return service
 
 def get_cell_value(cell: Dict) -> Any:
     """Extract the formatted or effective value from a cell."""
@@ -70,40 +137,85 @@ def get_cell_value(cell: Dict) -> Any:
     
     return None
 
-def extract_sheet_data(service, spreadsheet_id: str, sheet_name: str, max_rows: int = 5000) -> Dict:
+def _tabulate_values(sheet_name: str, values: List[List[Any]]) -> Dict:
+    """
+    Convert one sheet's raw value rows into the tabular output dict.
+
+    Shared by the batchGet path and the per-sheet fallback so both produce
+    identical output.
+
+    Args:
+        sheet_name: Name of the sheet
+        values: Row-major cell values as returned by the values API
+
+    Returns:
+        Dictionary with sheet data in tabular format
+    """
+    if not values:
+        return {
+            'sheet_name': sheet_name,
+            'is_empty': True,
+            'rows': []
+        }
+
+    # Extract headers (first row)
+    headers = values[0]
+
+    # Normalize headers (ensure unique); dict.get keeps it to one hash
+    # probe per header instead of a membership test plus an update
+    normalized_headers = []
+    counts = {}
+    for i, header in enumerate(headers):
+        header = str(header).strip() if header else f"Column{i+1}"
+        n = counts.get(header, 0)
+        counts[header] = n + 1
+        normalized_headers.append(header if n == 0 else f"{header}_{n}")
+
+    # Assemble column arrays first (structure-of-arrays): one append per
+    # cell, no throwaway padding list per row. The pivot back to row dicts
+    # happens only at the boundary because the documented output schema
+    # (directives/analyze_google_sheet.md) is row-oriented
+    num_cols = len(normalized_headers)
+    cols = [[] for _ in range(num_cols)]
+    pad = repeat(None)
+    for row_values in values[1:]:  # Skip header row
+        # zip stops at the last column while chain+repeat pads short rows,
+        # so ragged rows need no per-row padding list or index bounds checks
+        for col, value in zip(cols, chain(row_values, pad)):
+            col.append(value if value not in ('', None) else None)
+
+    rows = [dict(zip(normalized_headers, record)) for record in zip(*cols)]
+
+    return {
+        'sheet_name': sheet_name,
+        'is_empty': False,
+        'dimensions': {
+            'rows': len(rows),
+            'columns': len(normalized_headers)
+        },
+        'headers': normalized_headers,
+        'data': rows
+    }
+
+def extract_sheet_data(service, spreadsheet_id: str, sheet_name: str,
+                       grid_props: Dict, max_rows: int = 5000) -> Dict:
     """
     Extract data from a single sheet in tabular format.
-    
+
     Args:
         service: Google Sheets API service
         spreadsheet_id: ID of the spreadsheet
         sheet_name: Name of the sheet to extract
+        grid_props: The sheet's gridProperties from the spreadsheet
+            metadata the caller already fetched
         max_rows: Maximum number of rows to fetch
-        
+
     Returns:
         Dictionary with sheet data in tabular format
     """
     try:
-        # First, get sheet properties
-        metadata = service.spreadsheets().get(
-            spreadsheetId=spreadsheet_id,
-            ranges=[sheet_name],
-            includeGridData=False
-        ).execute()
-        
-        sheets = metadata.get('sheets', [])
-        if not sheets:
-            return {
-                'sheet_name': sheet_name,
-                'is_empty': True,
-                'rows': []
-            }
-        
-        properties = sheets[0].get('properties', {})
-        grid_props = properties.get('gridProperties', {})
         actual_rows = grid_props.get('rowCount', 0)
-        actual_cols = grid_props.get('columnCount', 0)
-        
+
         # Limit range if too large
         if actual_rows > max_rows:
             print(f"  ⚠ Limiting to {max_rows} rows (sheet has {actual_rows})", file=sys.stderr)
@@ -118,54 +230,8 @@ def extract_sheet_data(service, spreadsheet_id: str, sheet_name: str, max_rows:
             valueRenderOption='FORMATTED_VALUE'  # Get formatted values (dates as strings)
         ).execute()
         
-        values = result.get('values', [])
-        
-        if not values:
-            return {
-                'sheet_name': sheet_name,
-                'is_empty': True,
-                'rows': []
-            }
-        
-        # Extract headers (first row)
-        headers = values[0] if values else []
-        
-        # Normalize headers (ensure unique)
-        normalized_headers = []
-        seen = {}
-        for i, header in enumerate(headers):
-            header = str(header).strip() if header else f"Column{i+1}"
-            if header in seen:
-                seen[header] += 1
-                header = f"{header}_{seen[header]}"
-            else:
-                seen[header] = 0
-            normalized_headers.append(header)
-        
-        # Convert to list of row dictionaries
-        rows = []
-        for row_values in values[1:]:  # Skip header row
-            # Pad row to match header length
-            padded_row = row_values + [''] * (len(normalized_headers) - len(row_values))
-            
-            # Create row dict
-            row_dict = {}
-            for header, value in zip(normalized_headers, padded_row):
-                row_dict[header] = value if value != '' else None
-            
-            rows.append(row_dict)
-        
-        return {
-            'sheet_name': sheet_name,
-            'is_empty': False,
-            'dimensions': {
-                'rows': len(rows),
-                'columns': len(normalized_headers)
-            },
-            'headers': normalized_headers,
-            'data': rows
-        }
-        
+        return _tabulate_values(sheet_name, result.get('values', []))
+
     except Exception as e:
         print(f"  ✗ Error extracting sheet '{sheet_name}': {str(e)}", file=sys.stderr)
         return {
@@ -201,13 +267,57 @@ def extract_spreadsheet_data(url_or_id: str, max_rows_per_sheet: int = 5000) ->
         # Get all sheets
         sheets = spreadsheet.get('sheets', [])
         sheet_names = [sheet['properties']['title'] for sheet in sheets]
-        
-        # Extract data from each sheet
+
+        # The metadata above already carries every sheet's gridProperties,
+        # so one batchGet fetches all sheets in a single round-trip instead
+        # of two sequential calls per sheet
+        ranges = []
+        for sheet in sheets:
+            name = sheet['properties']['title']
+            row_count = sheet['properties'].get('gridProperties', {}).get('rowCount', 0)
+            if row_count > max_rows_per_sheet:
+                print(f"  ⚠ Limiting '{name}' to {max_rows_per_sheet} rows "
+                      f"(sheet has {row_count})", file=sys.stderr)
+                ranges.append(f"'{name}'!A1:ZZZ{max_rows_per_sheet}")
+            else:
+                ranges.append(f"'{name}'")
+
         sheets_data = []
-        for sheet_name in sheet_names:
-            print(f"Extracting: {sheet_name}...", file=sys.stderr)
-            sheet_data = extract_sheet_data(service, spreadsheet_id, sheet_name, max_rows_per_sheet)
-            sheets_data.append(sheet_data)
+        if ranges:
+            try:
+                batch = service.spreadsheets().values().batchGet(
+                    spreadsheetId=spreadsheet_id,
+                    ranges=ranges,
+                    valueRenderOption='FORMATTED_VALUE'
+                ).execute()
+                for sheet_name, value_range in zip(sheet_names, batch.get('valueRanges', [])):
+                    print(f"Extracting: {sheet_name}...", file=sys.stderr)
+                    sheets_data.append(_tabulate_values(sheet_name, value_range.get('values', [])))
+            except HttpError:
+                # Very large workbooks can push batchGet past response size
+                # limits; fall back to concurrent per-sheet fetches
+                print("  ⚠ batchGet failed; falling back to per-sheet fetches", file=sys.stderr)
+                payloads = None
+                if aiohttp is not None:
+                    try:
+                        payloads = _fetch_values_async(spreadsheet_id, ranges)
+                    except Exception as err:
+                        print(f"  ⚠ Concurrent fetch failed ({err}); using threads",
+                              file=sys.stderr)
+                if payloads is not None:
+                    for sheet_name, payload in zip(sheet_names, payloads):
+                        print(f"Extracting: {sheet_name}...", file=sys.stderr)
+                        sheets_data.append(
+                            _tabulate_values(sheet_name, payload.get('values', [])))
+                else:
+                    with ThreadPoolExecutor(max_workers=min(8, len(sheets))) as pool:
+                        sheets_data = list(pool.map(
+                            lambda sheet: extract_sheet_data(
+                                _worker_service(), spreadsheet_id,
+                                sheet['properties']['title'],
+                                sheet['properties'].get('gridProperties', {}),
+                                max_rows_per_sheet),
+                            sheets))
         
         # Compile result
         result = {
@@ -258,7 +368,10 @@ def main():
         tmp_dir.mkdir(exist_ok=True)
         
         output_file = tmp_dir / f"sheet_data_{spreadsheet_id}.json"
-        output_file.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+        if orjson is not None:
+            output_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            output_file.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
         
         print(f"\n✓ Extraction complete!", file=sys.stderr)
         print(f"  Spreadsheet: {data['title']}", file=sys.stderr)
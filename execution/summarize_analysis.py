@@ -1,19 +1,27 @@
 """Quick script to summarize sheet analysis"""
 import json
 import sys
+from pathlib import Path
+
+# orjson parses multi-MB structure dumps noticeably faster; optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 if len(sys.argv) < 2:
     print("Usage: python summarize_analysis.py <json_file>")
     sys.exit(1)
 
-with open(sys.argv[1], 'r', encoding='utf-8') as f:
-    data = json.load(f)
+raw = Path(sys.argv[1]).read_bytes()
+data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 print(f"\n📊 Spreadsheet: {data['title']}")
 print(f"🔗 URL: {data['spreadsheet_url']}")
 print(f"🌍 Locale: {data['locale']} | Timezone: {data['timezone']}")
 print(f"\n📄 Sheets: {data['sheet_count']}\n")
 
+total_rows = 0
 for i, sheet in enumerate(data['sheets'], 1):
     if sheet.get('is_empty'):
         print(f"{i}. {sheet['sheet_name']}: EMPTY")
@@ -21,8 +29,13 @@ for i, sheet in enumerate(data['sheets'], 1):
         print(f"{i}. {sheet['sheet_name']}: ERROR - {sheet['error']}")
     else:
         dims = sheet.get('dimensions', {})
-        rows = dims.get('row_count', 0)
-        cols = dims.get('column_count', 0)
+        # analyze_sheet_structure writes "row_count"/"column_count",
+        # extract_sheet_structure writes "rows"/"columns"; accept both
+        rows = dims.get('row_count', dims.get('rows', 0))
+        cols = dims.get('column_count', dims.get('columns', 0))
+        total_rows += rows
         print(f"{i}. {sheet['sheet_name']}: {rows} rows × {cols} columns")
 
-print(f"\n📈 Total rows across all sheets: {data['analysis_summary']['total_rows']}")
+# Structure dumps carry no analysis_summary; fall back to the sum above
+summary = data.get('analysis_summary', {})
+print(f"\n📈 Total rows across all sheets: {summary.get('total_rows', total_rows)}")